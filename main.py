@@ -3,8 +3,15 @@
 """
 import os
 import sys
+import json
+import math
+import time
+import inspect
 import random
-from typing import List, Optional, Dict
+import functools
+import threading
+import traceback
+from typing import List, Optional, Dict, Any, Callable, Tuple
 import yaml
 from dotenv import load_dotenv
 
@@ -26,7 +33,7 @@ from PySide6.QtWidgets import (
     QProgressBar,
     QListWidget,
 )
-from PySide6.QtCore import Qt, QThread, Signal
+from PySide6.QtCore import Qt, QThread, QTimer, Signal
 from PySide6.QtGui import QFont
 
 try:
@@ -36,7 +43,7 @@ except ImportError:
     GEMINI_AVAILABLE = False
 
 try:
-    from openai import OpenAI
+    from openai import OpenAI, APIStatusError, AuthenticationError, RateLimitError
     OPENAI_AVAILABLE = True
 except ImportError:
     OPENAI_AVAILABLE = False
@@ -66,29 +73,533 @@ CATEGORY_PRODUCTS: Dict[str, List[str]] = load_category_products()
 RANDOM_POPULAR_PRODUCTS = [item for sublist in CATEGORY_PRODUCTS.values() for item in sublist]
 
 
+def env_number(
+    name: str,
+    default,
+    cast: Callable = int,
+    minimum: Optional[float] = None,
+    maximum: Optional[float] = None,
+):
+    """환경변수를 숫자로 읽기
+
+    값이 없거나 형식이 잘못됐거나 유한한 수가 아니면(nan, inf) 경고 후 기본값을 사용하고,
+    minimum/maximum이 주어지면 그 범위로 제한한다.
+    """
+    value = os.getenv(name, "").strip()
+    if not value:
+        return default
+    try:
+        number = cast(value)
+    except ValueError:
+        number = None
+    if number is None or not math.isfinite(number):
+        print(f"경고: {name} 환경변수 값이 올바르지 않아 기본값({default})을 사용합니다: {value!r}")
+        return default
+    if minimum is not None and number < minimum:
+        number = cast(minimum)
+    if maximum is not None and number > maximum:
+        number = cast(maximum)
+    return number
+
+
+# UI 프로파일링 설정 (UI_PROFILE=1 일 때만 활성화)
+UI_PROFILE_ENABLED = os.getenv("UI_PROFILE", "").strip().lower() in ("1", "true", "yes", "on")
+UI_PROFILE_TRACE_PATH = os.getenv("UI_PROFILE_TRACE", "ui_trace.json")
+UI_PROFILE_HEARTBEAT_MS = env_number("UI_PROFILE_HEARTBEAT_MS", 50) if UI_PROFILE_ENABLED else 50
+UI_PROFILE_STALL_MS = env_number("UI_PROFILE_STALL_MS", 200) if UI_PROFILE_ENABLED else 200
+
+
+class UIProfiler:
+    """Qt 이벤트 루프 지연 측정 및 메인 스레드 프로파일링
+
+    - 하트비트 타이머로 이벤트 루프 지연(lag)을 측정
+    - 메인 스레드가 임계값 이상 멈추면 감시 스레드에서 스택을 샘플링
+    - MainWindow 슬롯별 실행 시간을 기록
+    - 종료 시 Chrome trace 형식(JSON)으로 저장 (chrome://tracing, Perfetto, speedscope에서 열람 가능)
+    """
+
+    # 이 값 미만의 이벤트 루프 지연은 기록하지 않음 (장시간 실행 시 trace 크기 제한)
+    LAG_FLOOR_MS = 5.0
+
+    def __init__(self, trace_path: str, heartbeat_ms: int, stall_ms: int):
+        self.trace_path = trace_path
+        self.heartbeat_ms = max(1, heartbeat_ms)
+        self.stall_ms = max(self.heartbeat_ms, stall_ms)
+        self._events: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+        self._origin = time.perf_counter()
+        self._main_thread_id = threading.get_ident()
+        self._last_beat = self._origin
+        self._beat_count = 0
+        self._lag_reported = False
+        self._stopped = False
+        self._stall_samples: List[Dict[str, Any]] = []
+        self._stop_event = threading.Event()
+        self._timer: Optional[QTimer] = None
+        self._watchdog: Optional[threading.Thread] = None
+
+    def _ts(self, t: float) -> float:
+        """perf_counter 값을 trace 기준 마이크로초로 변환"""
+        return (t - self._origin) * 1_000_000
+
+    def _add_event(self, event: Dict[str, Any]):
+        event.setdefault("pid", os.getpid())
+        with self._lock:
+            self._events.append(event)
+
+    def start(self):
+        """하트비트 타이머와 감시 스레드 시작 (메인 스레드에서 호출)"""
+        self._last_beat = time.perf_counter()
+        self._timer = QTimer()
+        self._timer.setInterval(self.heartbeat_ms)
+        self._timer.timeout.connect(self._on_heartbeat)
+        self._timer.start()
+
+        self._watchdog = threading.Thread(
+            target=self._watch_main_thread, name="ui-stall-watchdog", daemon=True
+        )
+        self._watchdog.start()
+
+    @property
+    def beat_count(self) -> int:
+        """지금까지 처리된 하트비트 수 (슬롯 내부 중첩 이벤트 루프 감지용)"""
+        return self._beat_count
+
+    def stop(self):
+        """측정을 중단하고 trace 파일 저장 (여러 번 호출해도 한 번만 저장)"""
+        if self._stopped:
+            return
+        self._stopped = True
+        if self._timer is not None:
+            self._timer.stop()
+        self._stop_event.set()
+        if self._watchdog is not None:
+            self._watchdog.join(timeout=1.0)
+        self.write_trace()
+
+    def _on_heartbeat(self):
+        """하트비트 타이머 콜백 - 예정 시각 대비 지연 기록"""
+        now = time.perf_counter()
+        with self._lock:
+            last_beat = self._last_beat
+            self._last_beat = now
+            samples = self._stall_samples
+            self._stall_samples = []
+        self._beat_count += 1
+
+        # 임계 미만 지연은 건너뛰고, 지연이 해소되면 카운터를 0으로 되돌리는 이벤트만 남긴다
+        lag_ms = max(0.0, (now - last_beat) * 1000 - self.heartbeat_ms)
+        if lag_ms >= self.LAG_FLOOR_MS or self._lag_reported:
+            self._lag_reported = lag_ms >= self.LAG_FLOOR_MS
+            self._add_event({
+                "name": "event_loop_lag",
+                "ph": "C",
+                "ts": self._ts(now),
+                "tid": self._main_thread_id,
+                "args": {"lag_ms": round(lag_ms, 3) if self._lag_reported else 0.0},
+            })
+
+        if lag_ms + self.heartbeat_ms >= self.stall_ms:
+            self._add_event({
+                "name": "main_thread_stall",
+                "cat": "stall",
+                "ph": "X",
+                "ts": self._ts(last_beat),
+                "dur": (now - last_beat) * 1_000_000,
+                "tid": self._main_thread_id,
+                "args": {"blocked_ms": round((now - last_beat) * 1000, 3), "samples": samples},
+            })
+
+    def _watch_main_thread(self):
+        """메인 스레드 멈춤 감시 - 임계값을 넘길 때마다 스택 샘플링"""
+        interval = self.heartbeat_ms / 1000
+        next_sample_at = self.stall_ms / 1000
+        while not self._stop_event.wait(interval):
+            now = time.perf_counter()
+            with self._lock:
+                blocked = now - self._last_beat
+            if blocked < self.stall_ms / 1000:
+                next_sample_at = self.stall_ms / 1000
+                continue
+            if blocked < next_sample_at:
+                continue
+            # 멈춤이 계속되면 stall_ms 간격으로 추가 샘플링
+            next_sample_at = blocked + self.stall_ms / 1000
+
+            frame = sys._current_frames().get(self._main_thread_id)
+            if frame is None:
+                continue
+            stack = [
+                f"{entry.filename}:{entry.lineno} {entry.name}"
+                for entry in traceback.extract_stack(frame)
+            ]
+            sample = {"blocked_ms": round(blocked * 1000, 3), "stack": stack}
+            with self._lock:
+                self._stall_samples.append(sample)
+            self._add_event({
+                "name": "stall_sample",
+                "cat": "stall",
+                "ph": "i",
+                "s": "t",
+                "ts": self._ts(now),
+                "tid": self._main_thread_id,
+                "args": sample,
+            })
+
+    def record_slot(self, name: str, start: float, end: float, beats_at_start: int):
+        """슬롯 실행 구간 기록
+
+        실행 중 하트비트가 처리됐다면 슬롯 안에서 중첩 이벤트 루프(예: 모달 QMessageBox)가
+        돌았다는 뜻이므로, 해당 구간은 메인 스레드 점유 시간이 아님을 args에 표시한다.
+        """
+        nested_beats = self._beat_count - beats_at_start
+        self._add_event({
+            "name": name,
+            "cat": "slot",
+            "ph": "X",
+            "ts": self._ts(start),
+            "dur": (end - start) * 1_000_000,
+            "tid": threading.get_ident(),
+            "args": {"nested_event_loop": nested_beats > 0, "nested_heartbeats": nested_beats},
+        })
+
+    def write_trace(self):
+        """수집한 이벤트를 Chrome trace 형식으로 저장"""
+        with self._lock:
+            events = list(self._events)
+        events.append({
+            "name": "thread_name",
+            "ph": "M",
+            "pid": os.getpid(),
+            "tid": self._main_thread_id,
+            "args": {"name": "main (Qt GUI)"},
+        })
+        try:
+            with open(self.trace_path, "w", encoding="utf-8") as f:
+                json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f, ensure_ascii=False)
+        except OSError as e:
+            print(f"경고: UI 프로파일링 trace 파일을 저장하지 못했습니다 ({self.trace_path}): {e}")
+
+
+# 활성화된 UI 프로파일러 (UI_PROFILE 미설정 시 None)
+_ui_profiler: Optional[UIProfiler] = None
+
+
+def profiled_slot(func: Callable) -> Callable:
+    """MainWindow 슬롯 실행 시간을 UI 프로파일러에 기록하는 데코레이터"""
+    code = func.__code__
+    # Qt는 가변 인자 슬롯에 시그널 인자를 모두 넘기므로 원래 슬롯의 인자 개수에 맞춰 자른다
+    max_args = None if code.co_flags & inspect.CO_VARARGS else code.co_argcount - 1
+
+    @functools.wraps(func)
+    def wrapper(self, *args):
+        if max_args is not None:
+            args = args[:max_args]
+        profiler = _ui_profiler
+        if profiler is None:
+            return func(self, *args)
+        beats_at_start = profiler.beat_count
+        start = time.perf_counter()
+        try:
+            return func(self, *args)
+        finally:
+            profiler.record_slot(
+                f"MainWindow.{func.__name__}", start, time.perf_counter(), beats_at_start
+            )
+
+    return wrapper
+
+
+# 자동 모델 선택 ("auto") 설정
+AUTO_MODEL = "auto"
+OPENAI_MODELS = [
+    "gpt-4",
+    "gpt-4-32k",
+    "gpt-4o",
+    "gpt-4o-mini",
+    "gpt-3.5-turbo",
+    "o1",
+    "o1-mini",
+    "o1-pro",
+    "o3",
+]
+# 모델별 대략적인 가격 (USD / 1M 토큰, 입력/출력)
+OPENAI_MODEL_PRICES: Dict[str, tuple] = {
+    "gpt-4": (30.0, 60.0),
+    "gpt-4-32k": (60.0, 120.0),
+    "gpt-4o": (2.5, 10.0),
+    "gpt-4o-mini": (0.15, 0.6),
+    "gpt-3.5-turbo": (0.5, 1.5),
+    "o1": (15.0, 60.0),
+    "o1-mini": (1.1, 4.4),
+    "o1-pro": (150.0, 600.0),
+    "o3": (2.0, 8.0),
+}
+AUTO_MODEL_DEFAULT = "gpt-4o-mini"
+AUTO_MODEL_MAX_COST = env_number("AUTO_MODEL_MAX_COST", 0.02, float, minimum=0)  # 요청당 USD 상한
+AUTO_MODEL_EXPLORE_RATE = env_number("AUTO_MODEL_EXPLORE_RATE", 0.1, float, minimum=0, maximum=1)
+AUTO_MODEL_STATS_PATH = os.getenv("AUTO_MODEL_STATS", "model_router_stats.json")
+
+
+def estimate_openai_cost(model: str, input_tokens: int, output_tokens: int) -> float:
+    """토큰 사용량으로 요청 비용(USD) 추정"""
+    input_price, output_price = OPENAI_MODEL_PRICES.get(model, (0.0, 0.0))
+    return (input_tokens * input_price + output_tokens * output_price) / 1_000_000
+
+
+def is_model_specific_error(error: Exception) -> bool:
+    """모델 자체에 책임이 있는 API 오류인지 판단
+
+    지원하지 않는 파라미터, 모델 접근 권한 없음 등 4xx 오류만 해당하며
+    인증·요청 한도·연결·서버 오류는 모델 성능과 무관하므로 제외한다.
+    """
+    if not OPENAI_AVAILABLE or not isinstance(error, APIStatusError):
+        return False
+    if isinstance(error, (AuthenticationError, RateLimitError)):
+        return False
+    return 400 <= error.status_code < 500
+
+
+class ModelRouter:
+    """관측된 속도·키워드 수율·비용 기반 자동 모델 선택기
+
+    모델별로 지연 시간, 파싱 후 유효 키워드 수, 비용의 지수이동평균을 유지하고
+    epsilon-greedy 정책으로 비용 상한 이내에서 초당 키워드 수가 가장 높은 모델을 고른다.
+    관측 비용만으로 상한을 넘은 모델(가격표 추정은 상한 이내)도 탐색 단계에서는 다시 시도한다.
+    모델 자체 오류로 연속 MAX_CONSECUTIVE_FAILURES회 실패한 모델은 탐색 대상에서 제외한다.
+    """
+
+    STAT_KEYS = ("count", "latency", "yield", "cost")
+    # 탐색 대상에서 제외하기까지 허용하는 연속 실패 횟수
+    MAX_CONSECUTIVE_FAILURES = 3
+
+    # 지수이동평균 가중치 (최근 관측 비중)
+    SMOOTHING = 0.3
+    # 관측 전 비용 추정에 쓰는 요청당 토큰 수 (입력, 출력)
+    PRIOR_TOKENS = (1500, 500)
+
+    def __init__(
+        self,
+        models: List[str],
+        max_cost: float = AUTO_MODEL_MAX_COST,
+        explore_rate: float = AUTO_MODEL_EXPLORE_RATE,
+        stats_path: Optional[str] = AUTO_MODEL_STATS_PATH,
+        default_model: str = AUTO_MODEL_DEFAULT,
+    ):
+        self.models = list(models)
+        self.max_cost = max_cost
+        self.explore_rate = explore_rate
+        self.stats_path = stats_path
+        self.default_model = default_model
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, float]] = {}
+        self._load_stats()
+
+    def _load_stats(self):
+        """이전 실행에서 저장한 통계 로드 (실패 시 무시)"""
+        if not self.stats_path or not os.path.exists(self.stats_path):
+            return
+        try:
+            with open(self.stats_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if isinstance(data, dict):
+            self._stats = {
+                model: {
+                    **{key: float(stats[key]) for key in self.STAT_KEYS},
+                    "failures": int(stats.get("failures", 0)),
+                }
+                for model, stats in data.items()
+                if model in self.models and self._is_valid_stats(stats)
+            }
+
+    @staticmethod
+    def _is_number(value) -> bool:
+        return isinstance(value, (int, float)) and not isinstance(value, bool) and math.isfinite(value)
+
+    @classmethod
+    def _is_valid_stats(cls, stats) -> bool:
+        """저장된 모델 통계 항목이 필요한 유한한 숫자 값을 모두 갖췄는지 확인"""
+        return (
+            isinstance(stats, dict)
+            and all(cls._is_number(stats.get(key)) and stats[key] >= 0 for key in cls.STAT_KEYS)
+            and cls._is_number(stats.get("failures", 0))
+        )
+
+    def _save_stats(self):
+        """통계 저장 (실패 시 무시)"""
+        if not self.stats_path:
+            return
+        try:
+            with open(self.stats_path, "w", encoding="utf-8") as f:
+                json.dump(self._stats, f, ensure_ascii=False, indent=2)
+        except OSError:
+            pass
+
+    def prior_cost(self, model: str) -> float:
+        """가격표 기반 요청당 비용 추정"""
+        return estimate_openai_cost(model, *self.PRIOR_TOKENS)
+
+    def expected_cost(self, model: str) -> float:
+        """모델의 요청당 예상 비용 (관측값 우선, 없으면 가격표 기반 추정)"""
+        stats = self._stats.get(model)
+        if stats and stats.get("count", 0) > 0:
+            return stats["cost"]
+        return self.prior_cost(model)
+
+    def score(self, model: str) -> Optional[float]:
+        """초당 유효 키워드 수 (관측 전이면 None)"""
+        stats = self._stats.get(model)
+        if not stats or stats.get("count", 0) == 0:
+            return None
+        return stats["yield"] / max(stats["latency"], 1e-3)
+
+    def is_failing(self, model: str) -> bool:
+        """연속 실패로 탐색 대상에서 제외된 모델인지 확인"""
+        stats = self._stats.get(model)
+        return bool(stats) and stats.get("failures", 0) >= self.MAX_CONSECUTIVE_FAILURES
+
+    def _exploit(self, exclude: Optional[str] = None) -> str:
+        """비용 상한 이내에서 초당 유효 키워드 수가 가장 높은 모델 (잠금 상태에서 호출)"""
+        candidates = [
+            m for m in self.models
+            if m != exclude and self.expected_cost(m) <= self.max_cost
+        ]
+        if not candidates:
+            return self.default_model
+
+        scored = [(self.score(m), m) for m in candidates if self.score(m) is not None]
+        if not scored:
+            return self.default_model if self.default_model in candidates else candidates[0]
+        return max(scored)[1]
+
+    def choose(self) -> Tuple[str, bool]:
+        """다음 요청에 사용할 모델 선택 - (모델, 탐색 여부) 반환"""
+        with self._lock:
+            # 가끔 무작위 모델로 탐색하여 통계를 최신으로 유지 (미관측 모델 우선)
+            # 관측 비용 때문에 제외된 모델도 가격표 추정이 상한 이내면 다시 시도한다
+            if random.random() < self.explore_rate:
+                explorable = [
+                    m for m in self.models
+                    if not self.is_failing(m)
+                    and min(self.expected_cost(m), self.prior_cost(m)) <= self.max_cost
+                ]
+                unseen = [m for m in explorable if self.score(m) is None]
+                if explorable:
+                    return random.choice(unseen or explorable), True
+
+            return self._exploit(), False
+
+    def fallback_model(self, exclude: str) -> Optional[str]:
+        """탐색 요청 실패 시 재시도할 모델 (실패한 모델과 같으면 None)"""
+        with self._lock:
+            model = self._exploit(exclude=exclude)
+        return None if model == exclude else model
+
+    def record(self, model: str, latency: float, keyword_count: int, cost: Optional[float]):
+        """성공한 요청 결과 반영 (파싱된 키워드가 0개여도 성공으로 본다)
+
+        토큰 사용량을 알 수 없으면(cost=None) 비용 평균은 그대로 둔다 (첫 관측이면 가격표 추정값 사용).
+        """
+        self._update(model, latency, keyword_count, cost, failed=False)
+
+    def record_failure(self, model: str, latency: float):
+        """모델 자체 오류로 실패한 요청 반영 (키워드 0개, 비용 평균 유지, 연속 실패 횟수 증가)"""
+        self._update(model, latency, 0, None, failed=True)
+
+    def _update(
+        self, model: str, latency: float, keyword_count: int, cost: Optional[float], failed: bool
+    ):
+        with self._lock:
+            stats = self._stats.get(model)
+            if not stats or stats.get("count", 0) == 0:
+                stats = {
+                    "count": 0,
+                    "latency": latency,
+                    "yield": float(keyword_count),
+                    "cost": cost if cost is not None else self.prior_cost(model),
+                }
+            else:
+                a = self.SMOOTHING
+                stats["latency"] = (1 - a) * stats["latency"] + a * latency
+                stats["yield"] = (1 - a) * stats["yield"] + a * keyword_count
+                if cost is not None:
+                    stats["cost"] = (1 - a) * stats["cost"] + a * cost
+            stats["count"] += 1
+            stats["failures"] = stats.get("failures", 0) + 1 if failed else 0
+            self._stats[model] = stats
+            self._save_stats()
+
+
 class KeywordGeneratorThread(QThread):
     """키워드 생성을 위한 백그라운드 스레드"""
     keywords_generated = Signal(list)
     error_occurred = Signal(str)
     progress_updated = Signal(str)
 
-    def __init__(self, category: str, llm_provider: str, model: Optional[str] = None):
+    def __init__(
+        self,
+        category: str,
+        llm_provider: str,
+        model: Optional[str] = None,
+        router: Optional[ModelRouter] = None,
+        explored: bool = False,
+    ):
         super().__init__()
         self.category = category
         self.llm_provider = llm_provider
         self.model = model
+        self.router = router
+        self.explored = explored
+        self.last_cost: Optional[float] = None
 
     def run(self):
         """키워드 생성 실행"""
         try:
-            self.progress_updated.emit("LLM에 요청 중...")
-            keywords = self._generate_keywords()
+            if self.router is not None and self.model:
+                self.progress_updated.emit(f"LLM에 요청 중... (자동 선택 모델: {self.model})")
+                keywords = self._generate_with_router()
+            else:
+                self.progress_updated.emit("LLM에 요청 중...")
+                keywords = self._generate_keywords()
             self.keywords_generated.emit(keywords)
         except KeyboardInterrupt:
             self.error_occurred.emit("사용자에 의해 작업이 취소되었습니다.")
         except Exception as e:
             self.error_occurred.emit(str(e))
 
+    def _generate_with_router(self) -> List[str]:
+        """자동 선택 모델로 키워드 생성
+
+        탐색으로 고른 모델이 모델 자체 오류로 실패하면 기본 선택 모델로 한 번 재시도한다.
+        """
+        try:
+            return self._generate_and_record()
+        except Exception as e:
+            if not (self.explored and is_model_specific_error(e)):
+                raise
+            fallback = self.router.fallback_model(exclude=self.model)
+            if fallback is None:
+                raise
+            self.model = fallback
+            self.explored = False
+            self.progress_updated.emit(f"LLM에 재요청 중... (자동 선택 모델: {fallback})")
+            return self._generate_and_record()
+
+    def _generate_and_record(self) -> List[str]:
+        """키워드 생성 후 결과를 라우터 통계에 반영 (모델과 무관한 오류는 기록하지 않음)"""
+        self.last_cost = None
+        start = time.perf_counter()
+        try:
+            keywords = self._generate_keywords()
+        except Exception as e:
+            if is_model_specific_error(e):
+                self.router.record_failure(self.model, time.perf_counter() - start)
+            raise
+        self.router.record(self.model, time.perf_counter() - start, len(keywords), self.last_cost)
+        return keywords
+
     def _generate_keywords(self) -> List[str]:
         """LLM을 사용하여 롱테일 키워드 생성"""
         prompt = f"""쿠팡파트너스 포스팅을 위한 롱테일 키워드를 생성해주세요.
@@ -242,6 +753,11 @@ class KeywordGeneratorThread(QThread):
                 temperature=0.7,
             )
 
+        if response.usage is not None:
+            self.last_cost = estimate_openai_cost(
+                model, response.usage.prompt_tokens, response.usage.completion_tokens
+            )
+
         keywords_text = response.choices[0].message.content.strip()
         keywords = [
             line.strip()
@@ -397,18 +913,8 @@ class MainWindow(QMainWindow):
         openai_model_layout.addWidget(self.openai_model_label)
         
         self.openai_model_combo = QComboBox()
-        openai_models = [
-            "gpt-4",
-            "gpt-4-32k",
-            "gpt-4o",
-            "gpt-4o-mini",
-            "gpt-3.5-turbo",
-            "o1",
-            "o1-mini",
-            "o1-pro",
-            "o3",
-        ]
-        self.openai_model_combo.addItems(openai_models)
+        # "auto": 관측된 속도·수율·비용으로 모델 자동 선택
+        self.openai_model_combo.addItems([AUTO_MODEL] + OPENAI_MODELS)
         self.openai_model_combo.setCurrentText("gpt-4o")  # 기본값
         self.openai_model_combo.setVisible(False)
         openai_model_layout.addWidget(self.openai_model_combo)
@@ -453,10 +959,10 @@ class MainWindow(QMainWindow):
         
         # 키워드 출력 섹션
         result_layout = QVBoxLayout()
-        result_label = QLabel("생성된 롱테일 키워드 (하나를 선택하세요):")
+        self.result_label = QLabel("생성된 롱테일 키워드 (하나를 선택하세요):")
         result_font = QFont("맑은 고딕", 10, QFont.Bold)
-        result_label.setFont(result_font)
-        result_layout.addWidget(result_label)
+        self.result_label.setFont(result_font)
+        result_layout.addWidget(self.result_label)
         
         self.keywords_list = QListWidget()
         self.keywords_list.setMaximumHeight(200)
@@ -505,24 +1011,31 @@ class MainWindow(QMainWindow):
         # 키워드 생성 스레드
         self.keyword_thread: Optional[KeywordGeneratorThread] = None
         
+        # OpenAI 자동 모델 선택기
+        self.model_router = ModelRouter(OPENAI_MODELS)
+        
         # 선택된 키워드 저장
         self.selected_keyword: Optional[str] = None
 
+    @profiled_slot
     def on_category_changed(self, category: str):
         """카테고리 변경 시 상품 리스트 업데이트"""
         self.product_list.clear()
         if category in CATEGORY_PRODUCTS:
             self.product_list.addItems(CATEGORY_PRODUCTS[category])
 
+    @profiled_slot
     def on_product_clicked(self, item):
         """상품 클릭 시 (단일 클릭)"""
         pass  # 더블클릭만 처리
 
+    @profiled_slot
     def on_product_selected(self, item):
         """상품 더블클릭 시 키워드 입력창에 자동 입력"""
         product_name = item.text()
         self.category_input.setText(product_name)
 
+    @profiled_slot
     def on_random_clicked(self):
         """Random 버튼 클릭 시 랜덤 상품 선택"""
         random_product = random.choice(RANDOM_POPULAR_PRODUCTS)
@@ -541,6 +1054,7 @@ class MainWindow(QMainWindow):
                         self.product_list.scrollToItem(items[0])
                 break
 
+    @profiled_slot
     def on_llm_provider_changed(self, provider: str):
         """LLM 제공자 변경 시 호출"""
         if provider == "OpenAI" and OPENAI_AVAILABLE:
@@ -550,6 +1064,7 @@ class MainWindow(QMainWindow):
             self.openai_model_label.setVisible(False)
             self.openai_model_combo.setVisible(False)
 
+    @profiled_slot
     def generate_keywords(self):
         """키워드 생성 시작"""
         category = self.category_input.text().strip()
@@ -570,11 +1085,24 @@ class MainWindow(QMainWindow):
         
         # OpenAI 모델 선택 확인
         model = None
+        router = None
+        explored = False
         if llm_provider == "OpenAI":
             model = self.openai_model_combo.currentText()
             if not model:
                 QMessageBox.warning(self, "입력 오류", "OpenAI 모델을 선택해주세요.")
                 return
+            if model == AUTO_MODEL:
+                router = self.model_router
+                model, explored = router.choose()
+        
+        # 자동 선택 시 사용된 모델 표시
+        if router is not None:
+            self.result_label.setText(
+                f"생성된 롱테일 키워드 (하나를 선택하세요) - 자동 선택 모델: {model}"
+            )
+        else:
+            self.result_label.setText("생성된 롱테일 키워드 (하나를 선택하세요):")
         
         # UI 업데이트
         self.generate_button.setEnabled(False)
@@ -582,17 +1110,28 @@ class MainWindow(QMainWindow):
         self.keywords_list.clear()
         
         # 스레드 생성 및 시작
-        self.keyword_thread = KeywordGeneratorThread(category, llm_provider, model)
+        self.keyword_thread = KeywordGeneratorThread(
+            category, llm_provider, model, router, explored
+        )
         self.keyword_thread.keywords_generated.connect(self.on_keywords_generated)
         self.keyword_thread.error_occurred.connect(self.on_error)
         self.keyword_thread.progress_updated.connect(self.on_progress_updated)
         self.keyword_thread.start()
 
+    @profiled_slot
     def on_keywords_generated(self, keywords: List[str]):
         """키워드 생성 완료 처리"""
         self.progress_bar.setVisible(False)
+        self.statusBar().clearMessage()
         self.generate_button.setEnabled(True)
         
+        # 탐색 실패 후 재시도한 경우 실제 사용된 모델로 표시 갱신
+        thread = self.keyword_thread
+        if thread is not None and thread.router is not None:
+            self.result_label.setText(
+                f"생성된 롱테일 키워드 (하나를 선택하세요) - 자동 선택 모델: {thread.model}"
+            )
+        
         if keywords:
             self.keywords_list.clear()
             self.keywords_list.addItems(keywords)
@@ -607,24 +1146,29 @@ class MainWindow(QMainWindow):
             self.prompt_button.setEnabled(False)
             QMessageBox.information(self, "알림", "생성된 키워드가 없습니다.")
 
+    @profiled_slot
     def on_error(self, error_message: str):
         """에러 처리"""
         self.progress_bar.setVisible(False)
+        self.statusBar().clearMessage()
         self.generate_button.setEnabled(True)
         self.keywords_list.clear()
         self.prompt_button.setEnabled(False)
         QMessageBox.critical(self, "오류", f"키워드 생성 중 오류가 발생했습니다:\n\n{error_message}")
 
+    @profiled_slot
     def on_progress_updated(self, message: str):
-        """진행 상태 업데이트"""
-        pass  # 진행 상태는 progress_bar로 표시
+        """진행 상태 업데이트 (자동 선택 시 사용 모델 포함)"""
+        self.statusBar().showMessage(message)
 
+    @profiled_slot
     def on_keyword_selected(self):
         """키워드 선택 변경 시 호출"""
         current_item = self.keywords_list.currentItem()
         if current_item:
             self.selected_keyword = current_item.text().strip()
 
+    @profiled_slot
     def generate_prompt(self):
         """선택된 키워드를 기반으로 프롬프트 생성"""
         # 선택된 키워드 확인
@@ -672,6 +1216,8 @@ class MainWindow(QMainWindow):
 
 def main():
     """애플리케이션 진입점"""
+    global _ui_profiler
+
     app = QApplication(sys.argv)
     
     # 애플리케이션 스타일 설정
@@ -681,6 +1227,15 @@ def main():
     default_font = QFont("맑은 고딕", 9)
     app.setFont(default_font)
     
+    # UI 프로파일링 모드 (UI_PROFILE=1)
+    if UI_PROFILE_ENABLED:
+        _ui_profiler = UIProfiler(
+            UI_PROFILE_TRACE_PATH, UI_PROFILE_HEARTBEAT_MS, UI_PROFILE_STALL_MS
+        )
+        _ui_profiler.start()
+        app.aboutToQuit.connect(_ui_profiler.stop)
+        print(f"UI 프로파일링 활성화: 종료 시 {UI_PROFILE_TRACE_PATH} 파일에 저장됩니다.")
+    
     try:
         window = MainWindow()
         window.show()
@@ -691,6 +1246,10 @@ def main():
     except Exception as e:
         print(f"애플리케이션 실행 중 오류 발생: {e}")
         sys.exit(1)
+    finally:
+        # 비정상 종료 시에도 trace 저장
+        if _ui_profiler is not None:
+            _ui_profiler.stop()
 
 
 if __name__ == "__main__":